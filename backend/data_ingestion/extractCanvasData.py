@@ -39,18 +39,22 @@ class CanvasDataIngestion:
     __metaID = None  # List of Canvas metadata info
     __courseID = None  # Course ID: Last number in the metaID
     __errors = None  # List of errors
+    __errorDirName = None  # Directory where the error JSON is written
 
     errors = list()  # Static list to keep track of all errors
 
     # Methods
-    def __init__(self, dirName):
+    def __init__(self, dirName, errorDirName="."):
         """
         Initialize an instance of CanvasDataIngestion.
 
         Args:
             dirName (str): The directory where Canvas data is located.
+            errorDirName (str): The directory where canvas_data_errors.json is
+                written. Defaults to the current working directory.
         """
         self.__dirName = dirName
+        self.__errorDirName = errorDirName
         self.__fileName = ""
         self.__data = ""
         self.__course = ""
@@ -256,7 +260,8 @@ class CanvasDataIngestion:
 
         if len(CanvasDataIngestion.errors) > 0:
             DataIngestionError.createErrorJSON(
-                "canvas_data_errors", CanvasDataIngestion.errors
+                os.path.join(self.__errorDirName, "canvas_data_errors"),
+                CanvasDataIngestion.errors,
             )
             CanvasDataIngestion.errors = list()
 
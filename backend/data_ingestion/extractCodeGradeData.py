@@ -43,6 +43,7 @@ class CodeGradeDataIngestion:
         __users (list): List of CodeGrade user IDs.
         __metaData (DataFrame): DataFrame containing CodeGrade metadata.
         __errors (list): List of errors encountered during data ingestion.
+        __errorDirName (str): Directory where the error JSON is written.
         fileSeen (set): Static set tracking all processed ZIP files.
         allErrors (list): Static list tracking all errors encountered.
     """
@@ -58,18 +59,22 @@ class CodeGradeDataIngestion:
     __users = None  # List of CodeGrade user IDs
     __metaData = None  # DataFrame containing CodeGrade metadata
     __errors = None
+    __errorDirName = None
 
     fileSeen = set()  # Static set tracking processed ZIP files
     allErrors = list()  # Static list tracking all errors encountered
 
-    def __init__(self, dirName):
+    def __init__(self, dirName, errorDirName="."):
         """
         Initialize the CodeGradeDataIngestion instance.
 
         Args:
             dirName (str): Name of the directory to be used for data processing.
+            errorDirName (str): Directory where codegrade_data_errors.json is
+                written. Defaults to the current working directory.
         """
         self.__dirName = dirName
+        self.__errorDirName = errorDirName
         self.__submissionFileName = ""
         self.__className = ""
         self.__section = ""
@@ -395,7 +400,8 @@ class CodeGradeDataIngestion:
 
         if len(CodeGradeDataIngestion.allErrors) > 0:
             DataIngestionError.createErrorJSON(
-                "codegrade_data_errors", CodeGradeDataIngestion.allErrors
+                os.path.join(self.__errorDirName, "codegrade_data_errors"),
+                CodeGradeDataIngestion.allErrors,
             )
             CodeGradeDataIngestion.allErrors = list()
             CodeGradeDataIngestion.fileSeen = set()
@@ -257,11 +257,6 @@ class API_Data:
         now = datetime.datetime.now()
 
         for assignment in assignments:
-            submissions = self.client.assignment.get_all_submissions(
-                assignment_id=assignment.id,
-                latest_only=True,
-            )
-
             lock_date = assignment.lock_date or assignment.deadline
             lock_dt = datetime.datetime(
                 lock_date.year,
@@ -272,9 +267,7 @@ class API_Data:
                 lock_date.second,
             )
 
-            if not submissions:
-                print(f"No submissions for {assignment.name}")
-                continue
+            # Check the lock date first so locked assignments cost no API call.
             if lock_dt > now:
                 print(
                     f"Lock date ({lock_dt}) not passed yet for {
@@ -282,6 +275,14 @@ class API_Data:
                 )
                 continue
 
+            submissions = self.client.assignment.get_all_submissions(
+                assignment_id=assignment.id,
+                latest_only=True,
+            )
+            if not submissions:
+                print(f"No submissions for {assignment.name}")
+                continue
+
             print(f"\nExtracting submission source code for {assignment.name}")
             output_dir = self.get_output_dir(self.course.name, assignment)
             student_dict = {"submission_ids": {}, "user_ids": {}}
@@ -310,13 +311,9 @@ class API_Data:
     def extract_csv(self, assignments):
         """Generate CSV files of assignment grades and student info."""
         print(f"\nExtracting CSVs for course: '{self.course.name}'")
+        now = datetime.datetime.now()
 
         for assignment in assignments:
-            submissions = self.client.assignment.get_all_submissions(
-                assignment_id=assignment.id,
-                latest_only=True,
-            )
-
             lock_date = assignment.lock_date or assignment.deadline
             lock_dt = datetime.datetime(
                 lock_date.year,
@@ -327,16 +324,22 @@ class API_Data:
                 lock_date.second,
             )
 
-            if not submissions:
-                print(f"No submissions for {assignment.name}")
-                continue
-            if lock_dt > datetime.datetime.now():
+            # Check the lock date first so locked assignments cost no API call.
+            if lock_dt > now:
                 print(
                     f"Lock date ({lock_dt}) not passed yet for {
                         assignment.name}"
                 )
                 continue
 
+            submissions = self.client.assignment.get_all_submissions(
+                assignment_id=assignment.id,
+                latest_only=True,
+            )
+            if not submissions:
+                print(f"No submissions for {assignment.name}")
+                continue
+
             file_path = self.get_output_dir(self.course.name, assignment) + ".csv"
             with open(file_path, "w", newline="") as f:
                 writer = csv.writer(f)
@@ -16,235 +16,302 @@ It verifies:
 # import csv
 # import shutil
 # import os
+# import zipfile
 
 # from data_ingestion.extractCodeGradeData import CodeGradeDataIngestion
 
+# BASELINE_FILE = "CS 135 1001 - 2024 Fall - Assignment 0"
+
+
+# class CodeGradeDataBuilder:
+#     """Write simulated CodeGrade export files into a data directory."""
+
+#     def __init__(self, dataDir):
+#         """Target `dataDir` for the files this builder writes."""
+#         self.dataDir = dataDir
+
+#     def createZIP(self, fileName, submissions, manifest=None):
+#         """Write a ZIP archive of student submissions and their metadata.
+
+#         Each submission becomes a folder holding an empty `main.cpp`, and the
+#         manifest, if given, is stored as `.cg-info.json`. Entries are written
+#         straight from memory and stored uncompressed.
+#         """
+#         zipPath = self.dataDir / f"{fileName}.zip"
+#         with zipfile.ZipFile(zipPath, "w", zipfile.ZIP_STORED) as zipFile:
+#             for z in submissions:
+#                 zipFile.writestr(f"{z}/main.cpp", "")
+#             if manifest is not None:
+#                 zipFile.writestr(".cg-info.json", json.dumps(manifest))
+
+#     def createCSV(self, csvData, fileName):
+#         """Create a CSV file in the data directory with given data."""
+#         with open(self.dataDir / f"{fileName}.csv", "w", newline="") as file:
+#             csv.writer(file).writerows(csvData)
+
+
+# @pytest.fixture(scope="module")
+# def baselineDir(tmp_path_factory):
+#     """Build the valid three-student submission set once per module.
+
+#     Only the tests that ingest it unchanged request a copy through the
+#     `baseline` fixture; the error-path tests build their own data.
+#     """
+#     builder = CodeGradeDataBuilder(tmp_path_factory.mktemp("codegrade_baseline"))
+
+#     builder.createZIP(
+#         BASELINE_FILE,
+#         ["0 - Mary Smith", "23 - James Johnson", "34 - John Jones"],
+#         {
+#             "submission_ids": {
+#                 "0 - Mary Smith": 0,
+#                 "23 - James Johnson": 23,
+#                 "34 - John Jones": 34,
+#             },
+#             "user_ids": {
+#                 "0 - Mary Smith": 100000,
+#                 "23 - James Johnson": 100001,
+#                 "34 - John Jones": 100003,
+#             },
+#         },
+#     )
+
+#     builder.createCSV(
+#         [
+#             ["Id", "Username", "Name", "Grade"],
+#             ["100000", "smithm", "Mary Smith", "79.1"],
+#             ["100001", "johnsj", "James Johnson", "81.7"],
+#             ["100003", "jonesj", "John Jones", "63.2"],
+#         ],
+#         BASELINE_FILE,
+#     )
+
+#     return builder.dataDir
+
+
+# def buildMissingJSON(builder):
+#     """Archive a submission without a `.cg-info.json` file."""
+#     builder.createZIP("CS 135 1001 - 2024 Fall - Assignment 1", ["0 - Mary Smith"])
+
+
+# def buildInvalidCSVName(builder):
+#     """Pair an archive with a metadata CSV named for another assignment."""
+#     builder.createZIP(
+#         "CS 135 1001 - 2024 Fall - Assignment 1",
+#         ["0 - Mary Smith"],
+#         {
+#             "submission_ids": {"0 - Mary Smith": 0},
+#             "user_ids": {"0 - Mary Smith": 100000},
+#         },
+#     )
+#     builder.createCSV(["error"], "CS 135 1001 - 2024 Fall - Assignment 2")
+
+
+# def buildNonMatchingSubmissionID(builder):
+#     """Give a student folder a different ID than the JSON submission ID."""
+#     builder.createZIP(
+#         "CS 135 1001 - 2024 Fall - Assignment 1",
+#         ["0 - Mary Smith"],
+#         {
+#             "submission_ids": {"0 - Mary Smith": 2},
+#             "user_ids": {"0 - Mary Smith": 100000},
+#         },
+#     )
+#     builder.createCSV(["error"], "CS 135 1001 - 2024 Fall - Assignment 1")
+
+
+# def buildNoStudentMetadata(builder):
+#     """Provide a metadata CSV with only a header row."""
+#     builder.createZIP(
+#         "CS 135 1001 - 2024 Fall - Assignment 2",
+#         ["0 - Mary Smith"],
+#         {
+#             "submission_ids": {"0 - Mary Smith": 0},
+#             "user_ids": {"0 - Mary Smith": 100000},
+#         },
+#     )
+#     builder.createCSV(
+#         [["Id", "Username", "Name", "Grade"]],
+#         "CS 135 1001 - 2024 Fall - Assignment 2",
+#     )
+
+
+# def buildMultipleStudentMetadata(builder):
+#     """Provide two metadata entries for the same user ID."""
+#     builder.createZIP(
+#         "CS 135 1001 - 2024 Fall - Assignment 3",
+#         ["0 - Mary Smith"],
+#         {
+#             "submission_ids": {"0 - Mary Smith": 0},
+#             "user_ids": {"0 - Mary Smith": 100000},
+#         },
+#     )
+#     builder.createCSV(
+#         [
+#             ["Id", "Username", "Name", "Grade"],
+#             ["100000", "smithm", "Mary Smith", "79.1"],
+#             ["100000", "smithm", "Mary Smith", "78.1"],
+#         ],
+#         "CS 135 1001 - 2024 Fall - Assignment 3",
+#     )
+
+
+# def buildNameNotMatchingUserID(builder):
+#     """Give the metadata entry a different name than the submission folder."""
+#     builder.createZIP(
+#         "CS 135 1001 - 2024 Fall - Assignment 4",
+#         ["0 - Mary Smith"],
+#         {
+#             "submission_ids": {"0 - Mary Smith": 0},
+#             "user_ids": {"0 - Mary Smith": 100000},
+#         },
+#     )
+#     builder.createCSV(
+#         [
+#             ["Id", "Username", "Name", "Grade"],
+#             ["100000", "smithm", "Mary Jane", "79.1"],
+#         ],
+#         "CS 135 1001 - 2024 Fall - Assignment 4",
+#     )
+
+
+# def buildMissingSubmissionInZIP(builder):
+#     """List a student in the JSON whose submission folder is not archived."""
+#     builder.createZIP(
+#         "CS 135 1001 - 2024 Fall - Assignment 5",
+#         ["23 - Paul Jones"],
+#         {
+#             "submission_ids": {
+#                 "0 - Mary Smith": 0,
+#                 "23 - Paul Jones": 23,
+#             },
+#             "user_ids": {
+#                 "0 - Mary Smith": 100000,
+#                 "23 - Paul Jones": 100001,
+#             },
+#         },
+#     )
+#     builder.createCSV(
+#         [
+#             ["Id", "Username", "Name", "Grade"],
+#             ["100000", "smithm", "Mary Jane", "79.1"],
+#             ["100001", "jonesj", "Paul Jones", "89.3"],
+#         ],
+#         "CS 135 1001 - 2024 Fall - Assignment 5",
+#     )
+
+
+# DUPLICATE_ZIP_MSG = (
+#     "A duplicate .zip file was found containing student submission in {dataDir}"
+# )
+
+# # (builder, expected message); {dataDir} is filled in with the test directory.
+# ERROR_CASES = [
+#     pytest.param(
+#         buildMissingJSON,
+#         "The .cg-info.json file is missing.",
+#         id="missing_cg_json_file",
+#     ),
+#     pytest.param(
+#         buildInvalidCSVName,
+#         "CS 135 1001 - 2024 Fall - Assignment 1.csv was not found in {dataDir}.",
+#         id="invalid_csv_file_name",
+#     ),
+#     pytest.param(
+#         buildNonMatchingSubmissionID,
+#         "The submission ID #0 for Mary Smith is not correct.",
+#         id="non_matching_student_submission_id",
+#     ),
+#     pytest.param(
+#         buildNoStudentMetadata,
+#         "User ID 100000 does not have any metadata associated with it.",
+#         id="no_student_metadata",
+#     ),
+#     pytest.param(
+#         buildMultipleStudentMetadata,
+#         "User ID 100000 has multiple metadata entries associated with it.",
+#         id="multiple_student_metadata",
+#     ),
+#     pytest.param(
+#         buildNameNotMatchingUserID,
+#         "User ID 100000 does not match the given name in the metadata file.",
+#         id="student_name_not_matching_user_id",
+#     ),
+#     pytest.param(
+#         buildMissingSubmissionInZIP,
+#         "Submission for Mary Smith is missing in zip directory.",
+#         id="student_missing_submission_in_zip",
+#     ),
+# ]
+
 
-# @pytest.mark.django_db
 # class TestExportCodeGradeData:
 #     """Test suite for CodeGradeDataIngestion error handling and data processing."""
 
-#     test_directory = "codegrade_data_test_directory"
-#     test_file = "CS 135 1001 - 2024 Fall - Assignment 0"
 #     errorFileName = "codegrade_data_errors.json"
 
 #     @pytest.fixture(autouse=True)
-#     def setup(self):
-#         """Set up and tear down the test environment for each test."""
-#         if not os.path.isdir(self.test_directory):
-#             os.mkdir(self.test_directory)
-
-#         self.ingest = CodeGradeDataIngestion(self.test_directory)
-
-#         self.createSubmissions(
-#             ["0 - Mary Smith", "23 - James Johnson", "34 - John Jones"]
-#         )
+#     def setup(self, tmp_path):
+#         """Set up an isolated CodeGrade data directory for each test.
 
-#         self.createJSON(
-#             {
-#                 "submission_ids": {
-#                     "0 - Mary Smith": 0,
-#                     "23 - James Johnson": 23,
-#                     "34 - John Jones": 34,
-#                 },
-#                 "user_ids": {
-#                     "0 - Mary Smith": 100000,
-#                     "23 - James Johnson": 100001,
-#                     "34 - John Jones": 100003,
-#                 },
-#             }
-#         )
+#         Everything lives under tmp_path, so tests can run in parallel
+#         (pytest -n auto) and pytest takes care of the cleanup.
+#         """
+#         self.tmpDir = tmp_path
+#         self.dataDir = tmp_path / "codegrade_data"
+#         self.test_directory = str(self.dataDir)
+#         self.dataDir.mkdir()
+#         self.builder = CodeGradeDataBuilder(self.dataDir)
 
-#         self.createZIP(self.test_file)
+#         # fileSeen and allErrors are class-level and only cleared once a run
+#         # writes its error file, so start every test from a clean slate
+#         # regardless of ordering.
+#         CodeGradeDataIngestion.fileSeen = set()
+#         CodeGradeDataIngestion.allErrors = list()
+#         self.ingest = CodeGradeDataIngestion(self.test_directory, str(self.tmpDir))
 
-#         self.createCSV(
-#             [
-#                 ["Id", "Username", "Name", "Grade"],
-#                 ["100000", "smithm", "Mary Smith", "79.1"],
-#                 ["100001", "johnsj", "James Johnson", "81.7"],
-#                 ["100003", "jonesj", "John Jones", "63.2"],
-#             ],
-#             self.test_file,
-#         )
+#     @pytest.fixture
+#     def baseline(self, baselineDir):
+#         """Link the prebuilt valid submission set into the test directory.
 
-#         yield
-
-#         shutil.rmtree(self.test_directory)
-#         if self.errorFileName in os.listdir():
-#             os.remove(self.errorFileName)
-
-#     def createSubmissions(self, zipData):
-#         """Create folders and placeholder files for simulated student submissions."""
-#         for z in zipData:
-#             path = os.path.join(self.test_directory, z)
-#             os.mkdir(path)
-#             open(os.path.join(path, "main.cpp"), "w").close()
-
-#     def createJSON(self, jsonData):
-#         """Write submission/user metadata to `.cg-info.json`."""
-#         with open(os.path.join(self.test_directory, ".cg-info.json"), "w") as jFile:
-#             json.dump(jsonData, jFile, indent=4)
-
-#     def createZIP(self, fileName):
-#         """Create ZIP archive of the test directory and move it back in."""
-#         shutil.make_archive(fileName, "zip", self.test_directory)
-#         shutil.rmtree(self.test_directory)
-#         os.mkdir(self.test_directory)
-#         shutil.move(
-#             f"{fileName}.zip", os.path.join(self.test_directory, f"{fileName}.zip")
+#         The ingester only reads the archive and CSV, so hard links are
+#         enough and no file contents are copied.
+#         """
+#         shutil.copytree(
+#             baselineDir, self.dataDir, dirs_exist_ok=True, copy_function=os.link
 #         )
 
-#     def createCSV(self, csvData, fileName):
-#         """Create a CSV file in the test directory with given data."""
-#         with open(os.path.join(self.test_directory, f"{fileName}.csv"), "w") as file:
-#             csv.writer(file).writerows(csvData)
-
 #     def runAndProduceError(self):
-#         """Run extraction and return first error message from generated JSON."""
+#         """Run extraction and return the first error message it reported."""
 #         self.ingest.extractData()
-#         assert self.errorFileName in os.listdir()
+#         return self.readErrorFile()
+
+#     def readErrorFile(self):
+#         """Return the first error message from the generated JSON file."""
+#         errorFile = self.tmpDir / self.errorFileName
+#         assert errorFile.is_file()
 
-#         with open(self.errorFileName, "r") as errors:
-#             jsonFile = json.load(errors)
-#             return jsonFile["errors"][0]["_DataIngestionError__msg"]
+#         jsonFile = json.loads(errorFile.read_bytes())
+#         return jsonFile["errors"][0]["_DataIngestionError__msg"]
 
-#     def test_valid_data(self):
+#     @pytest.mark.django_db
+#     def test_valid_data(self, baseline):
 #         """Ensure valid data does not generate an error file."""
 #         self.ingest.extractData()
-#         assert self.errorFileName not in os.listdir()
-
-#     def test_duplicate_zip_files_found(self):
-#         """Detect and report duplicate .zip files in the directory."""
-#         open(
-#             os.path.join(
-#                 self.test_directory,
-#                 f"{
-#                     self.test_file}.zip",
-#             ),
-#             "w",
-#         ).close()
-#         expected = f"A duplicate .zip file was found containing student submission in {
-#             self.test_directory}"
-#         assert self.runAndProduceError() == expected
-
-#     def test_missing_cg_json_file(self):
-#         """Detect missing `.cg-info.json` in zip contents."""
-#         self.createSubmissions(["0 - Mary Smith"])
-#         self.createZIP("CS 135 1001 - 2024 Fall - Assignment 1")
-#         assert self.runAndProduceError() == "The .cg-info.json file is missing."
-
-#     def test_invalid_csv_file_name(self):
-#         """Detect CSV file mismatch based on expected name."""
-#         self.createSubmissions(["0 - Mary Smith"])
-#         self.createJSON(
-#             {
-#                 "submission_ids": {"0 - Mary Smith": 0},
-#                 "user_ids": {"0 - Mary Smith": 100000},
-#             }
-#         )
-#         self.createZIP("CS 135 1001 - 2024 Fall - Assignment 1")
-#         self.createCSV(["error"], "CS 135 1001 - 2024 Fall - Assignment 2")
-#         expected = (
-#             "CS 135 1001 - 2024 Fall - Assignment 1.csv was not found in "
-#             f"{self.test_directory}."
-#         )
-#         assert self.runAndProduceError() == expected
+#         assert not (self.tmpDir / self.errorFileName).exists()
 
-#     def test_non_matching_student_submission_id(self):
-#         """Detect when student folder ID does not match JSON submission ID."""
-#         self.createSubmissions(["0 - Mary Smith"])
-#         self.createJSON(
-#             {
-#                 "submission_ids": {"0 - Mary Smith": 2},
-#                 "user_ids": {"0 - Mary Smith": 100000},
-#             }
-#         )
-#         self.createZIP("CS 135 1001 - 2024 Fall - Assignment 1")
-#         self.createCSV(["error"], "CS 135 1001 - 2024 Fall - Assignment 1")
-#         expected = "The submission ID #0 for Mary Smith is not correct."
-#         assert self.runAndProduceError() == expected
-
-#     def test_no_student_metadata(self):
-#         """Detect absence of student metadata in CSV file."""
-#         self.createSubmissions(["0 - Mary Smith"])
-#         self.createJSON(
-#             {
-#                 "submission_ids": {"0 - Mary Smith": 0},
-#                 "user_ids": {"0 - Mary Smith": 100000},
-#             }
-#         )
-#         self.createZIP("CS 135 1001 - 2024 Fall - Assignment 2")
-#         self.createCSV(
-#             [["Id", "Username", "Name", "Grade"]],
-#             "CS 135 1001 - 2024 Fall - Assignment 2",
-#         )
-#         expected = "User ID 100000 does not have any metadata associated with it."
-#         assert self.runAndProduceError() == expected
-
-#     def test_multiple_student_metadata(self):
-#         """Detect duplicate user ID entries in the metadata file."""
-#         self.createSubmissions(["0 - Mary Smith"])
-#         self.createJSON(
-#             {
-#                 "submission_ids": {"0 - Mary Smith": 0},
-#                 "user_ids": {"0 - Mary Smith": 100000},
-#             }
-#         )
-#         self.createZIP("CS 135 1001 - 2024 Fall - Assignment 3")
-#         self.createCSV(
-#             [
-#                 ["Id", "Username", "Name", "Grade"],
-#                 ["100000", "smithm", "Mary Smith", "79.1"],
-#                 ["100000", "smithm", "Mary Smith", "78.1"],
-#             ],
-#             "CS 135 1001 - 2024 Fall - Assignment 3",
-#         )
-#         expected = "User ID 100000 has multiple metadata entries associated with it."
-#         assert self.runAndProduceError() == expected
+#     @pytest.mark.django_db
+#     def test_duplicate_zip_files_found(self, baseline):
+#         """Detect and report a .zip file that has already been ingested."""
+#         self.ingest.extractData()
+#         assert not (self.tmpDir / self.errorFileName).exists()
 
-#     def test_student_name_not_matching_user_id(self):
-#         """Detect name mismatch between metadata and user ID."""
-#         self.createSubmissions(["0 - Mary Smith"])
-#         self.createJSON(
-#             {
-#                 "submission_ids": {"0 - Mary Smith": 0},
-#                 "user_ids": {"0 - Mary Smith": 100000},
-#             }
-#         )
-#         self.createZIP("CS 135 1001 - 2024 Fall - Assignment 4")
-#         self.createCSV(
-#             [
-#                 ["Id", "Username", "Name", "Grade"],
-#                 ["100000", "smithm", "Mary Jane", "79.1"],
-#             ],
-#             "CS 135 1001 - 2024 Fall - Assignment 4",
-#         )
-#         expected = "User ID 100000 does not match the given name in the metadata file."
+#         expected = DUPLICATE_ZIP_MSG.format(dataDir=self.test_directory)
 #         assert self.runAndProduceError() == expected
 
-#     def test_student_missing_submission_in_zip(self):
-#         """Detect missing submission folder for a student defined in JSON."""
-#         self.createSubmissions(["23 - Paul Jones"])
-#         self.createJSON(
-#             {
-#                 "submission_ids": {
-#                     "0 - Mary Smith": 0,
-#                     "23 - Paul Jones": 23,
-#                 },
-#                 "user_ids": {
-#                     "0 - Mary Smith": 100000,
-#                     "23 - Paul Jones": 100001,
-#                 },
-#             }
-#         )
-#         self.createZIP("CS 135 1001 - 2024 Fall - Assignment 5")
-#         self.createCSV(
-#             [
-#                 ["Id", "Username", "Name", "Grade"],
-#                 ["100000", "smithm", "Mary Jane", "79.1"],
-#                 ["100001", "jonesj", "Paul Jones", "89.3"],
-#             ],
-#             "CS 135 1001 - 2024 Fall - Assignment 5",
-#         )
-#         expected = "Submission for Mary Smith is missing in zip directory."
+#     @pytest.mark.parametrize("build, expected", ERROR_CASES)
+#     def test_error_path(self, build, expected):
+#         """Detect and report each malformed CodeGrade data set."""
+#         build(self.builder)
+#         expected = expected.format(dataDir=self.test_directory)
 #         assert self.runAndProduceError() == expected
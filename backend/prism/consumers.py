@@ -2,6 +2,13 @@
 
 from channels.generic.websocket import AsyncWebsocketConsumer
 import json
+import logging
+
+# Create a logger for this module.
+logger = logging.getLogger(__name__)
+
+# The connect confirmation never changes, so it is encoded once.
+CONNECTED_MESSAGE = json.dumps({"message": "WebSocket connected"})
 
 
 class MyConsumer(AsyncWebsocketConsumer):
@@ -29,7 +36,7 @@ class MyConsumer(AsyncWebsocketConsumer):
             JSON message: {"message": "WebSocket connected"}
         """
         await self.accept()
-        await self.send(text_data=json.dumps({"message": "WebSocket connected"}))
+        await self.send(text_data=CONNECTED_MESSAGE)
 
     async def receive(self, text_data):
         """Handle incoming WebSocket message.
@@ -55,4 +62,4 @@ class MyConsumer(AsyncWebsocketConsumer):
         Returns:
             None
         """
-        print(f"WebSocket disconnected: {close_code}")
+        logger.info("WebSocket disconnected: %s", close_code)
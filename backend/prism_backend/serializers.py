@@ -5,14 +5,44 @@ from google.auth.transport import requests
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 from rest_framework_simplejwt.tokens import RefreshToken
-from datetime import datetime, timezone
 from dotenv import load_dotenv
 import os
+import threading
+import time
 
 load_dotenv()
 
 User = get_user_model()
 
+_google_transport = threading.local()
+
+
+def get_google_request():
+    """Return this thread's transport for Google certificate fetches.
+
+    requests.Session is not documented as thread-safe, so each worker
+    thread lazily opens its own and reuses it across logins.
+
+    Returns:
+        google.auth.transport.requests.Request: The thread's transport.
+    """
+    request = getattr(_google_transport, "request", None)
+    if request is None:
+        request = _google_transport.request = requests.Request()
+    return request
+
+
+def format_expiration(timestamp):
+    """Format a JWT expiration timestamp as an ISO 8601 UTC string.
+
+    Args:
+        timestamp (int): Seconds since the epoch, as stored in a token's "exp".
+
+    Returns:
+        str: The time in the form "YYYY-MM-DDTHH:MM:SSZ".
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp))
+
 
 class GoogleAuthSerializer(serializers.Serializer):
     """Serializer for validating Google ID tokens and issuing JWT credentials.
@@ -51,7 +81,7 @@ class GoogleAuthSerializer(serializers.Serializer):
         try:
             google_info = id_token.verify_oauth2_token(
                 id_token=id_token_str,
-                request=requests.Request(),
+                request=get_google_request(),
                 audience=os.getenv("GOOGLE_CLIENT_ID"),
             )
 
@@ -64,20 +94,11 @@ class GoogleAuthSerializer(serializers.Serializer):
             refresh = RefreshToken.for_user(user)
             access_token = refresh.access_token
 
-            access_exp = (
-                datetime.fromtimestamp(access_token["exp"], tz=timezone.utc)
-                .isoformat()
-                .replace("+00:00", "Z")
-            )
-
-            refresh_exp = (
-                datetime.fromtimestamp(refresh["exp"], tz=timezone.utc)
-                .isoformat()
-                .replace("+00:00", "Z")
-            )
+            access_exp = format_expiration(access_token["exp"])
+            refresh_exp = format_expiration(refresh["exp"])
 
             return {
-                "access": str(refresh.access_token),
+                "access": str(access_token),
                 "refresh": str(refresh),
                 "user": {
                     "pk": user.pk,